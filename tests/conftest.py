@@ -1 +1,44 @@
-# to add fixtures here when we will need them
+import socket
+from urllib.parse import urlsplit
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Allow network access only for integration tests.
+
+    Sockets are disabled by default (`--disable-socket` in addopts), so a unit
+    test that accidentally reaches the network fails instead of silently
+    depending on it.
+    """
+    for item in items:
+        if item.get_closest_marker("integration"):
+            item.add_marker(pytest.mark.enable_socket)
+
+
+@pytest.fixture(scope="session")
+def skip_unless_reachable():
+    """
+    Skip the calling test unless the hosts of the given API URLs accept connections.
+
+    Each host is probed once per session with a short timeout so that
+    integration tests can skip quickly on offline machines instead of waiting
+    for the client timeout.
+    """
+    reachable = {}
+
+    def check(*urls):
+        for url in urls:
+            host = urlsplit(url).hostname
+            if host not in reachable:
+                try:
+                    socket.create_connection((host, 443), timeout=0.5).close()
+                except OSError:
+                    reachable[host] = False
+                else:
+                    reachable[host] = True
+            if not reachable[host]:
+                pytest.skip(f"{host} is not reachable")
+
+    return check
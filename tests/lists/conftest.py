@@ -0,0 +1,21 @@
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from tickersnap.lists import AssetsListAPI
+
+
+@pytest.fixture(scope="session")
+def assets_api():
+    """
+    Shared AssetsListAPI instance for mocked unit tests.
+
+    Skips `__init__` so no real `httpx.Client` is built; the client is a
+    `Mock(spec=httpx.Client)` created once per session. Tests must reset
+    `client.get` before configuring it.
+    """
+    api = AssetsListAPI.__new__(AssetsListAPI)
+    api.timeout = 10
+    api.client = Mock(spec=httpx.Client)
+    yield api
@@ -10,13 +10,86 @@ Tests cover:
 - Class constants access
 """
 
-from unittest.mock import Mock, patch
-
+import re
+import string
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from unittest.mock import Mock
+
+import httpx
 import pytest
 
 from tickersnap.lists import AssetsListAPI
 from tickersnap.lists.models import AssetData, AssetsListResponse, AssetType
 
+_MOCK_RESPONSE = {
+    "success": True,
+    "data": [
+        {
+            "sid": "TEST",
+            "name": "Test Company Ltd",
+            "ticker": "TESTCO",
+            "type": "stock",
+            "slug": "/stocks/test-company-TEST",
+            "isin": "INE123456789",
+        }
+    ],
+}
+
+_MOCK_RESPONSE_ETF = {
+    "success": True,
+    "data": [
+        *_MOCK_RESPONSE["data"],
+        {
+            "sid": "TETF",
+            "name": "Test ETF",
+            "ticker": "TESTETF",
+            "type": "etf",
+            "slug": "/etfs/test-etf-TETF",
+            "isin": "INF987654321",
+        },
+    ],
+}
+
+
+_sid = attrgetter("sid")
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_EXPECTED_SORTED = (*string.ascii_lowercase, "others")
+_VALID_TYPES = frozenset((AssetType.STOCK, AssetType.ETF))
+
+_ASSET_FIELD_TYPES = {
+    "sid": str,
+    "name": str,
+    "ticker": str,
+    "type": AssetType,
+    "slug": str,
+    "isin": str,
+}
+
+# expected error message patterns per filter validation failure
+# (`{filter}` is replaced by the escaped filter value)
+_INVALID = (
+    r"Invalid filter '{filter}'.*Valid options are:.*"
+    r"All filters are case insensitive"
+)
+_EMPTY = (
+    r"Empty filter '{filter}' not allowed.*"
+    r"Use filter=None or omit the parameter to get all assets.*Valid filters:"
+)
+_PADDED = (
+    r"Filter '{filter}' contains leading or trailing whitespaces.*"
+    r"Please remove the whitespaces and try again.*Valid filters:"
+)
+
+
+@pytest.fixture(scope="session")
+def mock_response():
+    """Successful mock HTTP response shared by the unit tests (read-only)."""
+    response = Mock()
+    response.json.return_value = _MOCK_RESPONSE
+    return response
+
 
 class TestUnitAssetsList:
     """
@@ -45,8 +118,7 @@ class TestUnitAssetsList:
         assert hasattr(AssetsListAPI, "VALID_FILTERS_SORTED_LIST")
 
         # validate VALID_LETTERS contains all lowercase letters
-        expected_letters = set("abcdefghijklmnopqrstuvwxyz")
-        assert AssetsListAPI.VALID_LETTERS == expected_letters
+        assert AssetsListAPI.VALID_LETTERS == _LOWERCASE
 
         # validate VALID_OTHERS contains 'others'
         assert AssetsListAPI.VALID_OTHERS == {"others"}
@@ -58,172 +130,131 @@ class TestUnitAssetsList:
         )
 
         # validate VALID_FILTERS_SORTED_LIST is properly ordered
-        expected_sorted = list("abcdefghijklmnopqrstuvwxyz") + ["others"]
-        assert AssetsListAPI.VALID_FILTERS_SORTED_LIST == expected_sorted
+        assert AssetsListAPI.VALID_FILTERS_SORTED_LIST == list(_EXPECTED_SORTED)
 
         # validate total count
         assert len(AssetsListAPI.VALID_FILTERS) == 27  # 26 letters + others
 
-    def test_filter_validation_valid_cases(self):
-        """Test filter validation with valid inputs."""
-        with AssetsListAPI() as assets:
-            with patch.object(assets.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.json.return_value = self._get_mock_api_response()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                # test valid letters (lowercase)
-                for letter in "abcdefghijklmnopqrstuvwxyz":
-                    result = assets.get_data(filter=letter)
-                    assert isinstance(result, AssetsListResponse)
-                    mock_get.assert_called_with(
-                        assets.BASE_URL, params={"filter": letter}
-                    )
-
-                # test 'others'
-                result = assets.get_data(filter="others")
-                assert isinstance(result, AssetsListResponse)
-                mock_get.assert_called_with(
-                    assets.BASE_URL, params={"filter": "others"}
-                )
-
-    def test_filter_validation_case_insensitive(self):
-        """Test that filter validation is case insensitive for letters and 'others'."""
-        with AssetsListAPI() as assets:
-            with patch.object(assets.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.json.return_value = self._get_mock_api_response()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                # test uppercase letters are converted to lowercase
-                for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-                    result = assets.get_data(filter=letter)
-                    assert isinstance(result, AssetsListResponse)
-                    # verify the actual API call used lowercase
-                    mock_get.assert_called_with(
-                        assets.BASE_URL, params={"filter": letter.lower()}
-                    )
-
-                # test 'others' variations are case insensitive
-                others_variations = ["others", "OTHERS", "Others", "OtHeRs"]
-                for others_filter in others_variations:
-                    result = assets.get_data(filter=others_filter)
-                    assert isinstance(result, AssetsListResponse)
-                    # verify the actual API call used lowercase 'others'
-                    mock_get.assert_called_with(
-                        assets.BASE_URL, params={"filter": "others"}
-                    )
-
-    def test_filter_validation_invalid_cases(self):
-        """Test filter validation with invalid inputs (non-empty and non-whitespace cases only)."""
-        with AssetsListAPI() as assets:
-            # test specific invalid filters that remain invalid even after .lower(), (non-empty and non-whitespace cases only)
-            invalid_filters = [
-                "invalid",  # word that's not a single letter or 'others'
-                "1",  # single numeric string
-                "123",  # multiple numeric string
-                "ab",  # multiple lowercase letters
-                "XYZ",  # multiple uppercase letters
-                "@",  # special character
-                "!@#",  # multiple special character
-            ]
-
-            for invalid_filter in invalid_filters:
-                with pytest.raises(ValueError) as exc_info:
-                    assets.get_data(filter=invalid_filter)
-
-                error_msg = str(exc_info.value)
-                assert f"Invalid filter '{invalid_filter}'" in error_msg
-                assert "Valid options are:" in error_msg
-                assert "All filters are case insensitive" in error_msg
-
-    def test_filter_validation_empty_and_whitespace_cases(self):
-        """Test filter validation with empty strings and whitespace."""
-        with AssetsListAPI() as assets:
-            # test empty filters (caught by empty filter validation)
-            empty_filters = [
-                "",  # empty string
-                " ",  # single space
-                "  ",  # multiple spaces
-                "\t",  # tab
-                "\n",  # newline
-                "   \t  ",  # mixed whitespace
-            ]
-
-            for empty_filter in empty_filters:
-                with pytest.raises(ValueError) as exc_info:
-                    assets.get_data(filter=empty_filter)
-
-                error_msg = str(exc_info.value)
-                assert f"Empty filter '{empty_filter}' not allowed" in error_msg
-                assert (
-                    "Use filter=None or omit the parameter to get all assets"
-                    in error_msg
-                )
-                assert "Valid filters:" in error_msg
-
-    def test_filter_validation_whitespace_padding_cases(self):
-        """Test filter validation with leading/trailing whitespace."""
-        with AssetsListAPI() as assets:
-            # test filters with leading/trailing whitespace
-            whitespace_filters = [
-                " a",  # leading space
-                "a ",  # trailing space
-                " a ",  # both leading and trailing
-                "  b",  # multiple leading spaces
-                "c  ",  # multiple trailing spaces
-                "\ta",  # leading tab
-                "z\n",  # trailing newline
-                " others ",  # whitespace around 'others'
-            ]
-
-            for ws_filter in whitespace_filters:
-                with pytest.raises(ValueError) as exc_info:
-                    assets.get_data(filter=ws_filter)
-
-                error_msg = str(exc_info.value)
-                assert (
-                    f"Filter '{ws_filter}' contains leading or trailing whitespaces"
-                    in error_msg
-                )
-                assert "Please remove the whitespaces and try again" in error_msg
-                assert "Valid filters:" in error_msg
-
-    def test_no_filter_parameter(self):
+    @pytest.fixture
+    def mock_get(self, assets_api, mock_response):
+        """Reset the shared client's `get` and wire a successful mock response."""
+        mock_get = assets_api.client.get
+        mock_get.reset_mock(return_value=True, side_effect=True)
+        mock_get.return_value = mock_response
+        return mock_get
+
+    @pytest.mark.parametrize("letter", list(string.ascii_lowercase))
+    def test_filter_valid_letter(self, assets_api, mock_get, letter):
+        """Test filter validation with valid lowercase letters."""
+        result = assets_api.get_data(filter=letter)
+        assert isinstance(result, AssetsListResponse)
+        mock_get.assert_called_once_with(assets_api.BASE_URL, params={"filter": letter})
+
+    @pytest.mark.parametrize("letter", list(string.ascii_uppercase))
+    def test_filter_case_insensitive_letter(self, assets_api, mock_get, letter):
+        """Test that uppercase letters are converted to lowercase."""
+        result = assets_api.get_data(filter=letter)
+        assert isinstance(result, AssetsListResponse)
+        # verify the actual API call used lowercase
+        mock_get.assert_called_once_with(
+            assets_api.BASE_URL, params={"filter": letter.lower()}
+        )
+
+    @pytest.mark.parametrize("others_filter", ["others", "OTHERS", "Others", "OtHeRs"])
+    def test_filter_case_insensitive_others(self, assets_api, mock_get, others_filter):
+        """Test that 'others' filter is case insensitive."""
+        result = assets_api.get_data(filter=others_filter)
+        assert isinstance(result, AssetsListResponse)
+        # verify the actual API call used lowercase 'others'
+        mock_get.assert_called_once_with(
+            assets_api.BASE_URL, params={"filter": "others"}
+        )
+
+    @pytest.mark.parametrize(
+        "filter_value, expected",
+        [(None, None), ("a", "a"), ("Z", "z"), ("OTHERS", "others")],
+    )
+    def test_validate_filter_normalizes(self, filter_value, expected):
+        """Test that valid filters are normalized without an HTTP client."""
+        assert AssetsListAPI._validate_filter(filter_value) == expected
+
+    def test_get_data_validates_before_request(self, assets_api, mock_get):
+        """Test that get_data rejects invalid filters before calling the API."""
+        with pytest.raises(ValueError, match="Invalid filter"):
+            assets_api.get_data(filter="invalid")
+
+        mock_get.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "bad_filter, expected_pattern",
+        [
+            # invalid filters that remain invalid even after .lower()
+            pytest.param("invalid", _INVALID, id="invalid-word"),
+            pytest.param("1", _INVALID, id="invalid-numeric"),
+            pytest.param("123", _INVALID, id="invalid-multi-numeric"),
+            pytest.param("ab", _INVALID, id="invalid-multi-lowercase"),
+            pytest.param("XYZ", _INVALID, id="invalid-multi-uppercase"),
+            pytest.param("@", _INVALID, id="invalid-special-char"),
+            pytest.param("!@#", _INVALID, id="invalid-multi-special-char"),
+            # empty filters (caught by empty filter validation)
+            pytest.param("", _EMPTY, id="empty-string"),
+            pytest.param(" ", _EMPTY, id="empty-single-space"),
+            pytest.param("  ", _EMPTY, id="empty-multi-space"),
+            pytest.param("\t", _EMPTY, id="empty-tab"),
+            pytest.param("\n", _EMPTY, id="empty-newline"),
+            pytest.param("   \t  ", _EMPTY, id="empty-mixed-whitespace"),
+            # filters with leading/trailing whitespace
+            pytest.param(" a", _PADDED, id="padded-leading-space"),
+            pytest.param("a ", _PADDED, id="padded-trailing-space"),
+            pytest.param(" a ", _PADDED, id="padded-both"),
+            pytest.param("  b", _PADDED, id="padded-multi-leading"),
+            pytest.param("c  ", _PADDED, id="padded-multi-trailing"),
+            pytest.param("\ta", _PADDED, id="padded-leading-tab"),
+            pytest.param("z\n", _PADDED, id="padded-trailing-newline"),
+            pytest.param(" others ", _PADDED, id="padded-others"),
+        ],
+    )
+    def test_filter_validation_errors(self, bad_filter, expected_pattern):
+        """Test filter validation rejects invalid, empty and whitespace-padded inputs."""
+        pattern = re.compile(
+            expected_pattern.format(filter=re.escape(bad_filter)), re.DOTALL
+        )
+        with pytest.raises(ValueError, match=pattern):
+            AssetsListAPI._validate_filter(bad_filter)
+
+    def test_case_insensitive_filters_normalized(self, assets_api, mock_get):
+        """Test that upper and lower case filters send identical API requests."""
+        for filter_value in ["a", "A", "others", "OTHERS"]:
+            assets_api.get_data(filter=filter_value)
+
+        # verify one request per call on the same client
+        assert mock_get.call_count == 4
+
+        # verify each case pair was normalized to the same request
+        lower_a, upper_a, lower_others, upper_others = mock_get.call_args_list
+        assert lower_a == upper_a
+        assert lower_others == upper_others
+        assert lower_a.kwargs["params"] == {"filter": "a"}
+        assert lower_others.kwargs["params"] == {"filter": "others"}
+
+    def test_no_filter_parameter(self, assets_api, mock_get):
         """Test API call without filter parameter."""
-        with AssetsListAPI() as assets:
-            with patch.object(assets.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.json.return_value = self._get_mock_api_response()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                result = assets.get_data()  # No filter
-                assert isinstance(result, AssetsListResponse)
-                # verify API call without filter parameter
-                mock_get.assert_called_with(assets.BASE_URL, params={})
-
-    def test_none_filter_parameter(self):
+        result = assets_api.get_data()  # No filter
+        assert isinstance(result, AssetsListResponse)
+        # verify API call without filter parameter
+        mock_get.assert_called_with(assets_api.BASE_URL, params={})
+
+    def test_none_filter_parameter(self, assets_api, mock_get):
         """Test API call with explicit None filter."""
-        with AssetsListAPI() as assets:
-            with patch.object(assets.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.json.return_value = self._get_mock_api_response()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                result = assets.get_data(filter=None)
-                assert isinstance(result, AssetsListResponse)
-                # verify API call without filter parameter
-                mock_get.assert_called_with(assets.BASE_URL, params={})
-
-    @patch("httpx.Client")
-    def test_context_manager(self, mock_client_class):
+        result = assets_api.get_data(filter=None)
+        assert isinstance(result, AssetsListResponse)
+        # verify API call without filter parameter
+        mock_get.assert_called_with(assets_api.BASE_URL, params={})
+
+    def test_context_manager(self, monkeypatch):
         """Test context manager functionality."""
         mock_client = Mock()
-        mock_client_class.return_value = mock_client
+        monkeypatch.setattr(httpx, "Client", lambda *args, **kwargs: mock_client)
 
         with AssetsListAPI() as assets:
             assert assets is not None
@@ -237,13 +268,10 @@ class TestUnitAssetsList:
         assets.close()
         # should not raise any exception
 
-    @patch("httpx.Client")
-    def test_http_error_handling(self, mock_client_class):
+    def test_http_error_handling(self, monkeypatch):
         """Test HTTP error handling."""
-        from httpx import HTTPStatusError, RequestError
-
         mock_client = Mock()
-        mock_client_class.return_value = mock_client
+        monkeypatch.setattr(httpx, "Client", lambda *args, **kwargs: mock_client)
 
         assets = AssetsListAPI()
 
@@ -251,14 +279,16 @@ class TestUnitAssetsList:
         mock_response = Mock()
         mock_response.status_code = 404
         mock_response.text = "Not Found"
-        http_error = HTTPStatusError("404", request=Mock(), response=mock_response)
+        http_error = httpx.HTTPStatusError(
+            "404", request=Mock(), response=mock_response
+        )
         mock_client.get.side_effect = http_error
 
         with pytest.raises(Exception, match="HTTP 404 error"):
             assets.get_data()
 
         # test request error
-        request_error = RequestError("Connection failed")
+        request_error = httpx.RequestError("Connection failed")
         mock_client.get.side_effect = request_error
 
         with pytest.raises(Exception, match="Request failed"):
@@ -266,327 +296,205 @@ class TestUnitAssetsList:
 
         assets.close()
 
-    def test_api_response_structure_validation(self):
+    def test_api_response_structure_validation(self, assets_api, mock_get):
         """Test that API response is properly validated against Pydantic models."""
-        with AssetsListAPI() as assets:
-            with patch.object(assets.client, "get") as mock_get:
-                # valid response
-                mock_response = Mock()
-                mock_response.json.return_value = self._get_mock_api_response()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                result = assets.get_data()
-
-                # validate response structure
-                assert isinstance(result, AssetsListResponse)
-                assert result.success is True
-                assert isinstance(result.data, list)
-                assert len(result.data) > 0
-
-                # validate asset data structure
-                asset = result.data[0]
-                assert isinstance(asset, AssetData)
-
-                # validate ALL main data fields exist and have correct types
-                assert hasattr(asset, "sid") and isinstance(asset.sid, str)
-                assert hasattr(asset, "name") and isinstance(asset.name, str)
-                assert hasattr(asset, "ticker") and isinstance(asset.ticker, str)
-                assert hasattr(asset, "type") and isinstance(asset.type, AssetType)
-                assert hasattr(asset, "slug") and isinstance(asset.slug, str)
-                assert hasattr(asset, "isin") and isinstance(asset.isin, str)
-
-                # validate asset type enum
-                assert asset.type in [AssetType.STOCK, AssetType.ETF]
-
-    def test_validation_error_handling(self):
-        """Test handling of Pydantic validation errors."""
-        with AssetsListAPI() as assets:
-            with patch.object(assets.client, "get") as mock_get:
-                # invalid response structure
-                mock_response = Mock()
-                mock_response.json.return_value = {
-                    "invalid": "response"
-                }  # Missing required fields
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                with pytest.raises(Exception, match="Data validation error"):
-                    assets.get_data()
-
-    def test_multiple_calls_same_client(self):
-        """Test making multiple API calls with the same client instance."""
-        assets = AssetsListAPI()
+        result = assets_api.get_data()
 
-        with patch.object(assets.client, "get") as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = self._get_mock_api_response()
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+        # validate response structure
+        assert isinstance(result, AssetsListResponse)
+        assert result.success is True
+        assert isinstance(result.data, list)
+        assert len(result.data) > 0
 
-            # make multiple calls
-            result1 = assets.get_data(filter="a")
-            result2 = assets.get_data(filter="b")
-            result3 = assets.get_data()
+        # validate asset data structure
+        asset = result.data[0]
+        assert isinstance(asset, AssetData)
 
-            # verify all calls succeeded
-            assert isinstance(result1, AssetsListResponse)
-            assert isinstance(result2, AssetsListResponse)
-            assert isinstance(result3, AssetsListResponse)
+        # validate ALL main data fields exist and have correct types
+        for field, field_type in _ASSET_FIELD_TYPES.items():
+            assert isinstance(getattr(asset, field), field_type), field
 
-            # verify correct number of calls
-            assert mock_get.call_count == 3
+        # validate asset type enum
+        assert asset.type in _VALID_TYPES
 
-        assets.close()
+    def test_validation_error_handling(self, assets_api, mock_get):
+        """Test handling of Pydantic validation errors."""
+        # invalid response structure
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "invalid": "response"
+        }  # Missing required fields
+        mock_get.return_value = mock_response
 
-    def test_api_response_data_integrity(self):
+        with pytest.raises(Exception, match="Data validation error"):
+            assets_api.get_data()
+
+    def test_api_response_data_integrity(self, assets_api, mock_get):
         """Test that asset data maintains integrity through model validation."""
-        with AssetsListAPI() as assets:
-            with patch.object(assets.client, "get") as mock_get:
-                mock_response = Mock()
-                mock_response.json.return_value = self._get_mock_api_response_with_etf()
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                result = assets.get_data()
-
-                # validate response structure
-                assert result.success is True
-                assert len(result.data) == 2  # stock + etf
-
-                # validate stock data
-                stock = result.data[0]
-                assert stock.sid == "TEST"
-                assert stock.name == "Test Company Ltd"
-                assert stock.ticker == "TESTCO"
-                assert stock.type == AssetType.STOCK
-                assert stock.slug == "/stocks/test-company-TEST"
-                assert stock.isin == "INE123456789"
-
-                # validate ETF data
-                etf = result.data[1]
-                assert etf.sid == "TETF"
-                assert etf.name == "Test ETF"
-                assert etf.ticker == "TESTETF"
-                assert etf.type == AssetType.ETF
-                assert etf.slug == "/etfs/test-etf-TETF"
-                assert etf.isin == "INF987654321"
-
-    def test_unexpected_error_handling(self):
+        mock_response = Mock()
+        mock_response.json.return_value = _MOCK_RESPONSE_ETF
+        mock_get.return_value = mock_response
+
+        result = assets_api.get_data()
+
+        # validate response structure
+        assert result.success is True
+        assert len(result.data) == 2  # stock + etf
+
+        # validate stock data
+        stock = result.data[0]
+        assert stock.sid == "TEST"
+        assert stock.name == "Test Company Ltd"
+        assert stock.ticker == "TESTCO"
+        assert stock.type == AssetType.STOCK
+        assert stock.slug == "/stocks/test-company-TEST"
+        assert stock.isin == "INE123456789"
+
+        # validate ETF data
+        etf = result.data[1]
+        assert etf.sid == "TETF"
+        assert etf.name == "Test ETF"
+        assert etf.ticker == "TESTETF"
+        assert etf.type == AssetType.ETF
+        assert etf.slug == "/etfs/test-etf-TETF"
+        assert etf.isin == "INF987654321"
+
+    def test_unexpected_error_handling(self, assets_api, mock_get):
         """Test handling of unexpected errors."""
-        with AssetsListAPI() as assets:
-            with patch.object(assets.client, "get") as mock_get:
-                # simulate unexpected error
-                mock_get.side_effect = RuntimeError("Unexpected error occurred")
-
-                with pytest.raises(Exception, match="Unexpected error"):
-                    assets.get_data()
-
-    def _get_mock_api_response(self):
-        """Generate mock API response for testing."""
-        return {
-            "success": True,
-            "data": [
-                {
-                    "sid": "TEST",
-                    "name": "Test Company Ltd",
-                    "ticker": "TESTCO",
-                    "type": "stock",
-                    "slug": "/stocks/test-company-TEST",
-                    "isin": "INE123456789",
-                }
-            ],
-        }
+        # simulate unexpected error
+        mock_get.side_effect = RuntimeError("Unexpected error occurred")
 
-    def _get_mock_api_response_with_etf(self):
-        """Generate mock API response with both stock and ETF for testing."""
-        return {
-            "success": True,
-            "data": [
-                {
-                    "sid": "TEST",
-                    "name": "Test Company Ltd",
-                    "ticker": "TESTCO",
-                    "type": "stock",
-                    "slug": "/stocks/test-company-TEST",
-                    "isin": "INE123456789",
-                },
-                {
-                    "sid": "TETF",
-                    "name": "Test ETF",
-                    "ticker": "TESTETF",
-                    "type": "etf",
-                    "slug": "/etfs/test-etf-TETF",
-                    "isin": "INF987654321",
-                },
-            ],
-        }
+        with pytest.raises(Exception, match="Unexpected error"):
+            assets_api.get_data()
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("tickertape")
 class TestIntegrationAssetsList:
     """
     Integration test suite for AssetsListAPI class with real API calls.
     These tests make actual HTTP requests to the Tickertape API.
     """
 
-    def test_real_api_call_no_filter(self):
+    @pytest.fixture(scope="class")
+    def assets(self, skip_unless_reachable):
+        """Single client shared by the class so its connection pool is reused."""
+        skip_unless_reachable(AssetsListAPI.BASE_URL)
+        with AssetsListAPI(timeout=30) as assets:
+            yield assets
+
+    def test_real_api_call_no_filter(self, assets):
         """Test real API call without filter to get all assets."""
-        with AssetsListAPI() as assets:
-            result = assets.get_data()
-
-            # validate response structure
-            assert isinstance(result, AssetsListResponse)
-            assert result.success is True
-            assert isinstance(result.data, list)
-            assert len(result.data) > 1000  # should have thousands of assets
-
-            # validate asset data structure
-            asset = result.data[0]
-            assert isinstance(asset, AssetData)
-            assert len(asset.sid) > 0
-            assert len(asset.name) > 0
-            assert len(asset.ticker) > 0
-            assert asset.type in [AssetType.STOCK, AssetType.ETF]
-            assert asset.slug.startswith("/")
-            assert len(asset.isin) > 0
-
-    def test_real_api_call_with_letter_filter(self):
+        result = assets.get_data()
+
+        # validate response structure
+        assert isinstance(result, AssetsListResponse)
+        assert result.success is True
+        assert isinstance(result.data, list)
+        assert len(result.data) > 1000  # should have thousands of assets
+
+        # validate asset data structure
+        asset = result.data[0]
+        assert isinstance(asset, AssetData)
+        assert len(asset.sid) > 0
+        assert len(asset.name) > 0
+        assert len(asset.ticker) > 0
+        assert asset.slug.startswith("/")
+        assert len(asset.isin) > 0
+
+        # validate every asset has a known type (single pass)
+        type_counts = Counter(asset.type for asset in result.data)
+        assert type_counts.keys() <= _VALID_TYPES
+        assert type_counts[AssetType.STOCK] > 0
+
+    def test_real_api_call_with_letter_filter(self, assets):
         """Test real API call with letter filter."""
-        with AssetsListAPI() as assets:
-            # test with 'a' filter
-            result = assets.get_data(filter="a")
+        # test with 'a' filter
+        result = assets.get_data(filter="a")
 
-            # validate response structure
-            assert isinstance(result, AssetsListResponse)
-            assert result.success is True
-            assert isinstance(result.data, list)
-            assert len(result.data) > 0
+        # validate response structure
+        assert isinstance(result, AssetsListResponse)
+        assert result.success is True
+        assert isinstance(result.data, list)
+        assert len(result.data) > 0
 
-            # validate all assets start with 'a' (case insensitive)
-            for asset in result.data:
-                assert asset.name.lower().startswith("a")
+        # validate all assets start with 'a' (case insensitive)
+        for asset in result.data:
+            assert asset.name.lower().startswith("a")
 
-    def test_real_api_call_with_others_filter(self):
+    def test_real_api_call_with_others_filter(self, assets):
         """Test real API call with 'others' filter."""
-        with AssetsListAPI() as assets:
-            result = assets.get_data(filter="others")
+        result = assets.get_data(filter="others")
 
-            # validate response structure
-            assert isinstance(result, AssetsListResponse)
-            assert result.success is True
-            assert isinstance(result.data, list)
-            assert len(result.data) > 0
+        # validate response structure
+        assert isinstance(result, AssetsListResponse)
+        assert result.success is True
+        assert isinstance(result.data, list)
+        assert len(result.data) > 0
 
-            # validate assets in 'others' don't start with letters
-            for asset in result.data:
-                first_char = asset.name[0].lower()
-                assert first_char not in "abcdefghijklmnopqrstuvwxyz"
+        # validate assets in 'others' don't start with letters
+        bad = [
+            asset.name for asset in result.data if asset.name[:1].lower() in _LOWERCASE
+        ]
+        assert not bad, f"Assets starting with letters in 'others': {bad}"
 
-    def test_real_api_call_case_insensitive(self):
-        """Test real API call with uppercase filter for letters and 'others'."""
-        with AssetsListAPI() as assets:
-            # test case insensitive letters
-            # get results with lowercase 'a'
-            result_lower = assets.get_data(filter="a")
-            # get results with uppercase 'A'
-            result_upper = assets.get_data(filter="A")
-
-            # should return identical results
-            assert len(result_lower.data) == len(result_upper.data)
-            assert result_lower.success == result_upper.success
-
-            # validate asset counts match
-            lower_sids = {asset.sid for asset in result_lower.data}
-            upper_sids = {asset.sid for asset in result_upper.data}
-            assert lower_sids == upper_sids
-
-            # test case insensitive 'others'
-            # get results with lowercase 'others'
-            result_others_lower = assets.get_data(filter="others")
-            # get results with uppercase 'OTHERS'
-            result_others_upper = assets.get_data(filter="OTHERS")
-
-            # should return identical results
-            assert len(result_others_lower.data) == len(result_others_upper.data)
-            assert result_others_lower.success == result_others_upper.success
-
-            # validate asset counts match
-            others_lower_sids = {asset.sid for asset in result_others_lower.data}
-            others_upper_sids = {asset.sid for asset in result_others_upper.data}
-            assert others_lower_sids == others_upper_sids
-
-    def test_real_api_completeness_validation(self):
+    def test_real_api_completeness_validation(self, assets):
         """Test that sum of all filters equals total assets."""
-        with AssetsListAPI() as assets:
-            # get total count
-            all_assets = assets.get_data()
-            total_count = len(all_assets.data)
-
-            # get count for each filter
-            filter_counts = {}
-            for filter_name in AssetsListAPI.VALID_FILTERS_SORTED_LIST:
-                filtered_assets = assets.get_data(filter=filter_name)
-                filter_counts[filter_name] = len(filtered_assets.data)
-
-            # sum should equal total
-            sum_of_filters = sum(filter_counts.values())
-            assert sum_of_filters == total_count, (
-                f"Sum of filters ({sum_of_filters}) != total ({total_count}). "
-                f"Filter breakdown: {filter_counts}"
+        # get total count
+        all_assets = assets.get_data()
+        total_count = len(all_assets.data)
+
+        # get count for each filter; a couple of requests in flight at a time
+        # stays well clear of the API's rate limits
+        filters = AssetsListAPI.VALID_FILTERS_SORTED_LIST
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = executor.map(
+                lambda filter_name: assets.get_data(filter=filter_name), filters
             )
+            filter_counts = {
+                filter_name: len(result.data)
+                for filter_name, result in zip(filters, results)
+            }
+
+        # sum should equal total
+        sum_of_filters = sum(filter_counts.values())
+        assert sum_of_filters == total_count, (
+            f"Sum of filters ({sum_of_filters}) != total ({total_count}). "
+            f"Filter breakdown: {filter_counts}"
+        )
 
-    def test_real_api_data_consistency(self):
+    def test_real_api_data_consistency(self, assets):
         """Test that API data is consistent across calls."""
-        with AssetsListAPI() as assets:
-            # make two identical calls
-            result1 = assets.get_data(filter="x")
-            result2 = assets.get_data(filter="x")
+        # make two identical calls
+        result1 = assets.get_data(filter="x")
+        result2 = assets.get_data(filter="x")
 
-            # should return identical results
-            assert len(result1.data) == len(result2.data)
-            assert result1.success == result2.success
+        # should return identical results
+        assert len(result1.data) == len(result2.data)
+        assert result1.success == result2.success
 
-            # validate asset data is identical
-            sids1 = {asset.sid for asset in result1.data}
-            sids2 = {asset.sid for asset in result2.data}
-            assert sids1 == sids2
+        # validate asset data is identical
+        sids1 = set(map(_sid, result1.data))
+        sids2 = set(map(_sid, result2.data))
+        assert sids1 == sids2
 
-    def test_real_api_asset_types_distribution(self):
+    def test_real_api_asset_types_distribution(self, assets):
         """Test that API returns both stocks and ETFs."""
-        with AssetsListAPI() as assets:
-            result = assets.get_data()
+        result = assets.get_data()
 
-            # check for both asset types
-            asset_types = {asset.type for asset in result.data}
-            assert AssetType.STOCK in asset_types
-            assert AssetType.ETF in asset_types
+        # count distribution in a single pass
+        type_counts = Counter(asset.type for asset in result.data)
 
-            # count distribution
-            stock_count = sum(
-                1 for asset in result.data if asset.type == AssetType.STOCK
-            )
-            etf_count = sum(1 for asset in result.data if asset.type == AssetType.ETF)
-
-            assert stock_count > 0
-            assert etf_count > 0
-            assert stock_count + etf_count == len(result.data)
-
-    def test_real_api_performance(self):
-        """Test API response performance."""
-        import time
-
-        with AssetsListAPI(
-            timeout=30
-        ) as assets:  # increased timeout for performance test
-            start_time = time.time()
-            result = assets.get_data()
-            end_time = time.time()
-
-            # validate response
-            assert isinstance(result, AssetsListResponse)
-            assert result.success is True
-
-            # check performance (should complete within reasonable time)
-            response_time = end_time - start_time
-            assert response_time < 10.0, f"API call took too long: {response_time:.2f}s"
+        # check for both asset types
+        assert type_counts[AssetType.STOCK] > 0
+        assert type_counts[AssetType.ETF] > 0
+        assert type_counts.keys() <= _VALID_TYPES
+
+    @pytest.mark.perf
+    def test_real_api_performance(self, assets, benchmark):
+        """Benchmark a full (unfiltered) assets list API call."""
+        result = benchmark.pedantic(assets.get_data, rounds=3, iterations=1)
+
+        # validate response
+        assert isinstance(result, AssetsListResponse)
+        assert result.success is True
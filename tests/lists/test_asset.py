@@ -9,13 +9,116 @@ Tests cover:
 - Edge cases
 """
 
-from unittest.mock import Mock, patch
+import time
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from pydantic import ValidationError
 
+from tickersnap.lists import AssetsListAPI
 from tickersnap.lists.asset import Assets
 from tickersnap.lists.models import AssetData, AssetsListResponse, AssetType
 
+_EXPECTED_ASSET_FIELDS = frozenset({"sid", "name", "ticker", "type", "slug", "isin"})
+
+
+@pytest.fixture(scope="session")
+def mock_assets_response():
+    """Mock API response with 2 stocks and 1 ETF, built once per session."""
+    return AssetsListResponse(
+        success=True,
+        data=[
+            AssetData(
+                sid="RELIANCE",
+                name="Reliance Industries Ltd",
+                ticker="RELIANCE",
+                type=AssetType.STOCK,
+                slug="reliance-industries-ltd",
+                isin="INE002A01018",
+            ),
+            AssetData(
+                sid="TCS",
+                name="Tata Consultancy Services Ltd",
+                ticker="TCS",
+                type=AssetType.STOCK,
+                slug="tata-consultancy-services-ltd",
+                isin="INE467B01029",
+            ),
+            AssetData(
+                sid="NIFTYBEES",
+                name="Nippon India ETF Nifty BeES",
+                ticker="NIFTYBEES",
+                type=AssetType.ETF,
+                slug="nippon-india-etf-nifty-bees",
+                isin="INF204KB17I5",
+            ),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_mixed_assets_response():
+    """Mixed 3-stock/2-ETF response for the filtering tests; never modified."""
+    return AssetsListResponse(
+        success=True,
+        data=[
+            AssetData(
+                sid="RELIANCE",
+                name="Reliance Industries Ltd",
+                ticker="RELIANCE",
+                type=AssetType.STOCK,
+                slug="reliance-industries-ltd",
+                isin="INE002A01018",
+            ),
+            AssetData(
+                sid="TCS",
+                name="Tata Consultancy Services Ltd",
+                ticker="TCS",
+                type=AssetType.STOCK,
+                slug="tata-consultancy-services-ltd",
+                isin="INE467B01029",
+            ),
+            AssetData(
+                sid="HDFC",
+                name="HDFC Bank Ltd",
+                ticker="HDFC",
+                type=AssetType.STOCK,
+                slug="hdfc-bank-ltd",
+                isin="INE040A01034",
+            ),
+            AssetData(
+                sid="NIFTYBEES",
+                name="Nippon India ETF Nifty BeES",
+                ticker="NIFTYBEES",
+                type=AssetType.ETF,
+                slug="nippon-india-etf-nifty-bees",
+                isin="INF204KB17I5",
+            ),
+            AssetData(
+                sid="BANKNIFTY",
+                name="Bank Nifty ETF",
+                ticker="BANKNIFTY",
+                type=AssetType.ETF,
+                slug="bank-nifty-etf",
+                isin="INF204KB18I6",
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def patched_api(monkeypatch):
+    """
+    Replace `AssetsListAPI` in the assets module with a mock class.
+
+    Returns the mock class and the client yielded by its context manager.
+    """
+    mock_client = Mock()
+    mock_assets_list_class = MagicMock()
+    mock_assets_list_class.return_value.__enter__.return_value = mock_client
+    monkeypatch.setattr("tickersnap.lists.asset.AssetsListAPI", mock_assets_list_class)
+    return mock_assets_list_class, mock_client
+
 
 class TestUnitAssets:
     """
@@ -32,107 +135,55 @@ class TestUnitAssets:
         assets = Assets(timeout=30)
         assert assets.timeout == 30
 
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_get_all_stocks_basic(self, mock_assets_list_class):
-        """Test get_all_stocks basic functionality."""
+    @pytest.mark.parametrize(
+        "method, expected_tickers, expected_types",
+        [
+            ("get_all_stocks", {"RELIANCE", "TCS"}, {AssetType.STOCK}),
+            ("get_all_etfs", {"NIFTYBEES"}, {AssetType.ETF}),
+            (
+                "get_all_assets",
+                {"RELIANCE", "TCS", "NIFTYBEES"},
+                {AssetType.STOCK, AssetType.ETF},
+            ),
+        ],
+    )
+    def test_get_all_basic(
+        self,
+        patched_api,
+        mock_assets_response,
+        method,
+        expected_tickers,
+        expected_types,
+    ):
+        """Test get_all_stocks, get_all_etfs and get_all_assets basic functionality."""
         # Setup mock
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
-        mock_response = self._create_mock_assets_response()
-        mock_client.get_data.return_value = mock_response
+        mock_assets_list_class, mock_client = patched_api
+        mock_client.get_data.return_value = mock_assets_response
 
         # Test
         assets = Assets(timeout=15)
-        result = assets.get_all_stocks()
+        result = getattr(assets, method)()
 
         # Validate structure
         assert isinstance(result, list)
-        assert len(result) == 2  # From mock - 2 stocks
+        assert len(result) == len(expected_tickers)
+        assert all(isinstance(asset, AssetData) for asset in result)
 
-        # Validate all returned items are stocks
-        for asset in result:
-            assert isinstance(asset, AssetData)
-            assert asset.type == AssetType.STOCK
-
-        # Validate specific data
-        stock_tickers = [asset.ticker for asset in result]
-        assert "RELIANCE" in stock_tickers
-        assert "TCS" in stock_tickers
+        # Validate returned types and specific data
+        assert {asset.type for asset in result} == expected_types
+        assert {asset.ticker for asset in result} == expected_tickers
 
         # Verify API usage
         mock_assets_list_class.assert_called_once_with(timeout=15)
         mock_client.get_data.assert_called_once_with()
 
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_get_all_etfs_basic(self, mock_assets_list_class):
-        """Test get_all_etfs basic functionality."""
-        # Setup mock
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
-        mock_response = self._create_mock_assets_response()
-        mock_client.get_data.return_value = mock_response
-
-        # Test
-        assets = Assets(timeout=20)
-        result = assets.get_all_etfs()
-
-        # Validate structure
-        assert isinstance(result, list)
-        assert len(result) == 1  # From mock - 1 ETF
-
-        # Validate all returned items are ETFs
-        for asset in result:
-            assert isinstance(asset, AssetData)
-            assert asset.type == AssetType.ETF
-
-        # Validate specific data
-        etf_tickers = [asset.ticker for asset in result]
-        assert "NIFTYBEES" in etf_tickers
-
-        # Verify API usage
-        mock_assets_list_class.assert_called_once_with(timeout=20)
-        mock_client.get_data.assert_called_once_with()
-
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_get_all_assets_basic(self, mock_assets_list_class):
-        """Test get_all_assets basic functionality."""
-        # Setup mock
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
-        mock_response = self._create_mock_assets_response()
-        mock_client.get_data.return_value = mock_response
-
-        # Test
-        assets = Assets()
-        result = assets.get_all_assets()
-
-        # Validate structure
-        assert isinstance(result, list)
-        assert len(result) == 3  # From mock - all assets
-
-        # Validate asset type distribution
-        stock_count = sum(1 for asset in result if asset.type == AssetType.STOCK)
-        etf_count = sum(1 for asset in result if asset.type == AssetType.ETF)
-        assert stock_count == 2
-        assert etf_count == 1
-
-        # Validate all returned items are AssetData
-        for asset in result:
-            assert isinstance(asset, AssetData)
-            assert asset.type in [AssetType.STOCK, AssetType.ETF]
-
-        # Verify API usage
-        mock_client.get_data.assert_called_once_with()
-
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_filtering_accuracy(self, mock_assets_list_class):
+    def test_filtering_accuracy(self, patched_api, mock_mixed_assets_response):
         """Test that filtering works correctly for different asset combinations."""
         # Setup mock with mixed assets
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
+        mock_assets_list_class, mock_client = patched_api
 
         # Create response with more diverse mix
-        mixed_response = self._create_mock_mixed_assets_response()
+        mixed_response = mock_mixed_assets_response
         mock_client.get_data.return_value = mixed_response
 
         assets = Assets()
@@ -157,12 +208,10 @@ class TestUnitAssets:
         all_tickers = {asset.ticker for asset in all_assets}
         assert all_tickers == {"RELIANCE", "TCS", "HDFC", "NIFTYBEES", "BANKNIFTY"}
 
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_empty_results_handling(self, mock_assets_list_class):
+    def test_empty_results_handling(self, patched_api):
         """Test handling when API returns empty results."""
         # Setup mock with empty response
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
+        mock_assets_list_class, mock_client = patched_api
         empty_response = AssetsListResponse(success=True, data=[])
         mock_client.get_data.return_value = empty_response
 
@@ -173,11 +222,9 @@ class TestUnitAssets:
         assert assets.get_all_etfs() == []
         assert assets.get_all_assets() == []
 
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_only_stocks_scenario(self, mock_assets_list_class):
+    def test_only_stocks_scenario(self, patched_api):
         """Test scenario where API returns only stocks."""
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
+        mock_assets_list_class, mock_client = patched_api
 
         # Response with only stocks
         stocks_only_response = AssetsListResponse(
@@ -214,11 +261,9 @@ class TestUnitAssets:
         assert len(etfs) == 0
         assert len(all_assets) == 2
 
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_only_etfs_scenario(self, mock_assets_list_class):
+    def test_only_etfs_scenario(self, patched_api):
         """Test scenario where API returns only ETFs."""
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
+        mock_assets_list_class, mock_client = patched_api
 
         # Response with only ETFs
         etfs_only_response = AssetsListResponse(
@@ -247,11 +292,9 @@ class TestUnitAssets:
         assert len(etfs) == 1
         assert len(all_assets) == 1
 
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_error_handling_api_failure(self, mock_assets_list_class):
+    def test_error_handling_api_failure(self, patched_api):
         """Test error handling when API calls fail."""
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
+        mock_assets_list_class, mock_client = patched_api
         mock_client.get_data.side_effect = Exception("API Error")
 
         assets = Assets()
@@ -266,13 +309,10 @@ class TestUnitAssets:
         with pytest.raises(Exception, match="API Error"):
             assets.get_all_assets()
 
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_multiple_calls_different_methods(self, mock_assets_list_class):
-        """Test multiple calls to different methods use fresh API calls."""
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
-        mock_response = self._create_mock_assets_response()
-        mock_client.get_data.return_value = mock_response
+    def test_multiple_calls_different_methods(self, patched_api, mock_assets_response):
+        """Test multiple calls to different methods reuse the cached assets list."""
+        mock_assets_list_class, mock_client = patched_api
+        mock_client.get_data.return_value = mock_assets_response
 
         assets = Assets()
 
@@ -281,47 +321,101 @@ class TestUnitAssets:
         etfs = assets.get_all_etfs()
         all_assets = assets.get_all_assets()
 
+        # Verify only the first call hit the API
+        assert mock_client.get_data.call_count == 1
+        assert len(stocks) == 2
+        assert len(etfs) == 1
+        assert len(all_assets) == 3
+
+    def test_force_refresh_fetches_again(self, patched_api, mock_assets_response):
+        """Test that force_refresh bypasses the cache on every method."""
+        mock_assets_list_class, mock_client = patched_api
+        mock_client.get_data.return_value = mock_assets_response
+
+        assets = Assets()
+
+        # Call all methods with force_refresh
+        stocks = assets.get_all_stocks(force_refresh=True)
+        etfs = assets.get_all_etfs(force_refresh=True)
+        all_assets = assets.get_all_assets(force_refresh=True)
+
         # Verify each method made its own API call
         assert mock_client.get_data.call_count == 3
         assert len(stocks) == 2
         assert len(etfs) == 1
         assert len(all_assets) == 3
 
-    def test_timeout_parameter_propagation(self):
+    def test_failed_fetch_is_not_cached(self, patched_api, mock_assets_response):
+        """Test that an API failure does not poison the cache."""
+        mock_assets_list_class, mock_client = patched_api
+        mock_client.get_data.side_effect = [
+            Exception("API Error"),
+            mock_assets_response,
+        ]
+
+        assets = Assets()
+
+        with pytest.raises(Exception, match="API Error"):
+            assets.get_all_stocks()
+
+        # next call retries and succeeds
+        assert len(assets.get_all_stocks()) == 2
+        assert mock_client.get_data.call_count == 2
+
+    def test_returned_lists_do_not_share_cache(self, patched_api, mock_assets_response):
+        """Test that mutating a returned list does not affect later calls."""
+        mock_assets_list_class, mock_client = patched_api
+        mock_client.get_data.return_value = mock_assets_response
+
+        assets = Assets()
+
+        assets.get_all_stocks().clear()
+        assets.get_all_etfs().clear()
+        assets.get_all_assets().clear()
+
+        assert len(assets.get_all_stocks()) == 2
+        assert len(assets.get_all_etfs()) == 1
+        assert len(assets.get_all_assets()) == 3
+
+    def test_asset_data_is_immutable(self, mock_assets_response):
+        """Test that AssetData instances cannot be modified after creation."""
+        asset = mock_assets_response.data[0]
+
+        with pytest.raises(ValidationError):
+            asset.ticker = "CHANGED"
+
+        # frozen models are hashable, so assets can be used in sets
+        assert len(set(mock_assets_response.data)) == 3
+
+    @pytest.mark.parametrize("timeout", [5, 15, 30, 60])
+    def test_timeout_parameter_propagation(
+        self, patched_api, mock_assets_response, timeout
+    ):
         """Test that timeout parameter is properly propagated to API client."""
-        with patch("tickersnap.lists.asset.AssetsListAPI") as mock_assets_list_class:
-            mock_client = Mock()
-            mock_assets_list_class.return_value.__enter__.return_value = mock_client
-            mock_client.get_data.return_value = self._create_mock_assets_response()
-
-            # Test different timeout values
-            timeout_values = [5, 15, 30, 60]
-            for timeout in timeout_values:
-                assets = Assets(timeout=timeout)
-                assets.get_all_stocks()
-
-                # Verify AssetsListAPI was called with correct timeout
-                mock_assets_list_class.assert_called_with(timeout=timeout)
-
-    @patch("tickersnap.lists.asset.AssetsListAPI")
-    def test_asset_data_integrity(self, mock_assets_list_class):
+        mock_assets_list_class, mock_client = patched_api
+        mock_client.get_data.return_value = mock_assets_response
+
+        assets = Assets(timeout=timeout)
+        assets.get_all_stocks()
+
+        # Verify AssetsListAPI was called with correct timeout
+        mock_assets_list_class.assert_called_once_with(timeout=timeout)
+
+    def test_asset_data_integrity(self, patched_api, mock_assets_response):
         """Test that returned asset data maintains integrity."""
-        mock_client = Mock()
-        mock_assets_list_class.return_value.__enter__.return_value = mock_client
-        mock_response = self._create_mock_assets_response()
+        mock_assets_list_class, mock_client = patched_api
+        mock_response = mock_assets_response
         mock_client.get_data.return_value = mock_response
 
         assets = Assets()
 
+        # Schema is invariant: check the declared fields once
+        assert AssetData.model_fields.keys() >= _EXPECTED_ASSET_FIELDS
+
         # Test stocks data integrity
         stocks = assets.get_all_stocks()
         for stock in stocks:
-            assert hasattr(stock, "sid")
-            assert hasattr(stock, "name")
-            assert hasattr(stock, "ticker")
-            assert hasattr(stock, "type")
-            assert hasattr(stock, "slug")
-            assert hasattr(stock, "isin")
+            assert isinstance(stock, AssetData)
             assert stock.sid is not None
             assert stock.name is not None
             assert stock.ticker is not None
@@ -330,96 +424,12 @@ class TestUnitAssets:
         # Test ETFs data integrity
         etfs = assets.get_all_etfs()
         for etf in etfs:
-            assert hasattr(etf, "sid")
-            assert hasattr(etf, "name")
-            assert hasattr(etf, "ticker")
-            assert hasattr(etf, "type")
-            assert hasattr(etf, "slug")
-            assert hasattr(etf, "isin")
+            assert isinstance(etf, AssetData)
             assert etf.type == AssetType.ETF
 
-    def _create_mock_assets_response(self):
-        """Create mock API response with mixed assets."""
-        return AssetsListResponse(
-            success=True,
-            data=[
-                AssetData(
-                    sid="RELIANCE",
-                    name="Reliance Industries Ltd",
-                    ticker="RELIANCE",
-                    type=AssetType.STOCK,
-                    slug="reliance-industries-ltd",
-                    isin="INE002A01018",
-                ),
-                AssetData(
-                    sid="TCS",
-                    name="Tata Consultancy Services Ltd",
-                    ticker="TCS",
-                    type=AssetType.STOCK,
-                    slug="tata-consultancy-services-ltd",
-                    isin="INE467B01029",
-                ),
-                AssetData(
-                    sid="NIFTYBEES",
-                    name="Nippon India ETF Nifty BeES",
-                    ticker="NIFTYBEES",
-                    type=AssetType.ETF,
-                    slug="nippon-india-etf-nifty-bees",
-                    isin="INF204KB17I5",
-                ),
-            ],
-        )
-
-    def _create_mock_mixed_assets_response(self):
-        """Create mock API response with more diverse asset mix."""
-        return AssetsListResponse(
-            success=True,
-            data=[
-                AssetData(
-                    sid="RELIANCE",
-                    name="Reliance Industries Ltd",
-                    ticker="RELIANCE",
-                    type=AssetType.STOCK,
-                    slug="reliance-industries-ltd",
-                    isin="INE002A01018",
-                ),
-                AssetData(
-                    sid="TCS",
-                    name="Tata Consultancy Services Ltd",
-                    ticker="TCS",
-                    type=AssetType.STOCK,
-                    slug="tata-consultancy-services-ltd",
-                    isin="INE467B01029",
-                ),
-                AssetData(
-                    sid="HDFC",
-                    name="HDFC Bank Ltd",
-                    ticker="HDFC",
-                    type=AssetType.STOCK,
-                    slug="hdfc-bank-ltd",
-                    isin="INE040A01034",
-                ),
-                AssetData(
-                    sid="NIFTYBEES",
-                    name="Nippon India ETF Nifty BeES",
-                    ticker="NIFTYBEES",
-                    type=AssetType.ETF,
-                    slug="nippon-india-etf-nifty-bees",
-                    isin="INF204KB17I5",
-                ),
-                AssetData(
-                    sid="BANKNIFTY",
-                    name="Bank Nifty ETF",
-                    ticker="BANKNIFTY",
-                    type=AssetType.ETF,
-                    slug="bank-nifty-etf",
-                    isin="INF204KB18I6",
-                ),
-            ],
-        )
-
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("tickertape")
 class TestIntegrationAssets:
     """
     Integration test suite for Assets class with real API calls.
@@ -427,10 +437,19 @@ class TestIntegrationAssets:
     These tests make actual API calls and validate real data.
     """
 
-    def test_get_all_stocks_integration(self):
+    @pytest.fixture(scope="class", autouse=True)
+    def _require_api(self, skip_unless_reachable):
+        """Skip the whole class when the assets list API host is offline."""
+        skip_unless_reachable(AssetsListAPI.BASE_URL)
+
+    @pytest.fixture(scope="class")
+    def live_assets(self):
+        """Single Assets instance for the class; its cached list is fetched once."""
+        return Assets(timeout=30)
+
+    def test_get_all_stocks_integration(self, live_assets):
         """Test get_all_stocks with real API call."""
-        assets = Assets(timeout=15)
-        result = assets.get_all_stocks()
+        result = live_assets.get_all_stocks()
 
         # Basic validation
         assert isinstance(result, list)
@@ -446,10 +465,9 @@ class TestIntegrationAssets:
             assert stock.slug is not None
             assert stock.isin is not None
 
-    def test_get_all_etfs_integration(self):
+    def test_get_all_etfs_integration(self, live_assets):
         """Test get_all_etfs with real API call."""
-        assets = Assets(timeout=15)
-        result = assets.get_all_etfs()
+        result = live_assets.get_all_etfs()
 
         # Basic validation
         assert isinstance(result, list)
@@ -465,10 +483,9 @@ class TestIntegrationAssets:
             assert etf.slug is not None
             assert etf.isin is not None
 
-    def test_get_all_assets_integration(self):
+    def test_get_all_assets_integration(self, live_assets):
         """Test get_all_assets with real API call."""
-        assets = Assets(timeout=15)
-        result = assets.get_all_assets()
+        result = live_assets.get_all_assets()
 
         # Basic validation
         assert isinstance(result, list)
@@ -484,14 +501,12 @@ class TestIntegrationAssets:
             result
         ), "All assets should be stocks or ETFs"
 
-    def test_consistency_across_methods(self):
+    def test_consistency_across_methods(self, live_assets):
         """Test that data is consistent across different method calls."""
-        assets = Assets(timeout=15)
-
         # Get data from all methods
-        all_assets = assets.get_all_assets()
-        all_stocks = assets.get_all_stocks()
-        all_etfs = assets.get_all_etfs()
+        all_assets = live_assets.get_all_assets()
+        all_stocks = live_assets.get_all_stocks()
+        all_etfs = live_assets.get_all_etfs()
 
         # Validate consistency
         assert len(all_assets) == len(all_stocks) + len(all_etfs)
@@ -505,12 +520,10 @@ class TestIntegrationAssets:
         assert etf_sids.issubset(all_asset_sids)
         assert stock_sids.isdisjoint(etf_sids)  # No overlap between stocks and ETFs
 
-    def test_data_quality_validation(self):
+    def test_data_quality_validation(self, live_assets):
         """Test that returned data meets quality expectations."""
-        assets = Assets(timeout=15)
-
         # Sample some assets for quality checks
-        all_assets = assets.get_all_assets()
+        all_assets = live_assets.get_all_assets()
         sample_size = min(20, len(all_assets))
         sample_assets = all_assets[:sample_size]
 
@@ -529,8 +542,6 @@ class TestIntegrationAssets:
 
     def test_performance_expectations(self):
         """Test that API calls complete within reasonable time."""
-        import time
-
         assets = Assets(timeout=30)  # Allow more time for real API
 
         # Test each method's performance
@@ -542,7 +553,8 @@ class TestIntegrationAssets:
 
         for method_name, method in methods_to_test:
             start_time = time.time()
-            result = method()
+            # bypass the cache so every call times a real fetch
+            result = method(force_refresh=True)
             end_time = time.time()
 
             duration = end_time - start_time
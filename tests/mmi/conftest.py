@@ -0,0 +1,108 @@
+import copy
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from tickersnap.mmi import MMIPeriodAPI
+
+# fixed timestamps shared by the mock response trees
+_T_NOW = datetime(2024, 1, 15, 10, 0, 0)
+_T_DAY = datetime(2024, 1, 14, 10, 0, 0)
+_T_WEEK = datetime(2024, 1, 8, 10, 0, 0)
+_T_MONTH = datetime(2023, 12, 15, 10, 0, 0)
+_T_YEAR = datetime(2023, 1, 15, 10, 0, 0)
+_T_PREV_DAY1 = _T_DAY
+_T_PREV_DAY2 = datetime(2024, 1, 13, 10, 0, 0)
+_T_PREV_MONTH = _T_MONTH
+
+# indicator values in the mock now-response and the changes they imply
+_EXPECTED_CHANGES = SimpleNamespace(
+    current=65.5,
+    day=60.0,
+    week=70.0,
+    month=55.0,
+    year=50.0,
+    vs_day=5.5,
+    vs_week=-4.5,
+    vs_month=10.5,
+    vs_year=15.5,
+)
+
+_DAYS_HIST = (
+    SimpleNamespace(date=_T_PREV_DAY1, indicator=62.1),
+    SimpleNamespace(date=_T_PREV_DAY2, indicator=59.8),
+)
+_MONTHS_HIST = (SimpleNamespace(date=_T_PREV_MONTH, indicator=67.4),)
+
+
+@pytest.fixture(scope="module")
+def mmi_period_api():
+    """
+    Shared MMIPeriodAPI instance for mocked unit tests.
+
+    Tests mock the transport (respx) per test, so a single real client can be
+    reused across the module instead of building one per test.
+    """
+    with MMIPeriodAPI() as api:
+        yield api
+
+
+@pytest.fixture(scope="module")
+def expected_changes():
+    """Indicator values in `now_response` and the vs_last_* changes they imply."""
+    return _EXPECTED_CHANGES
+
+
+@pytest.fixture(scope="module")
+def now_response():
+    """
+    Mock MMINowResponse tree (SimpleNamespace), built once per module.
+
+    Shared and read-only; use `now_response_factory` for a modified copy.
+    """
+    mock_data = SimpleNamespace(
+        date=_T_NOW,
+        indicator=_EXPECTED_CHANGES.current,
+        current_value=_EXPECTED_CHANGES.current,
+        fii=-50000,
+        nifty=21500.0,
+        vix=-12.5,
+        # historical data
+        last_day=SimpleNamespace(date=_T_DAY, indicator=_EXPECTED_CHANGES.day),
+        last_week=SimpleNamespace(date=_T_WEEK, indicator=_EXPECTED_CHANGES.week),
+        last_month=SimpleNamespace(date=_T_MONTH, indicator=_EXPECTED_CHANGES.month),
+        last_year=SimpleNamespace(date=_T_YEAR, indicator=_EXPECTED_CHANGES.year),
+    )
+
+    return SimpleNamespace(success=True, data=mock_data)
+
+
+@pytest.fixture
+def now_response_factory(now_response):
+    """Build shallow copies of `now_response` with a different indicator."""
+
+    def make(indicator=_EXPECTED_CHANGES.current):
+        response = copy.copy(now_response)
+        response.data = copy.copy(now_response.data)
+        response.data.indicator = indicator
+        response.data.current_value = indicator
+        return response
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def period_response():
+    """Mock MMIPeriodResponse tree (SimpleNamespace), built once per module."""
+    mock_data = SimpleNamespace(
+        date=_T_NOW,
+        indicator=58.3,
+        fii=-45000,
+        nifty=21800.0,
+        # historical data arrays (read-only, so tuples)
+        days_historical=_DAYS_HIST,
+        months_historical=_MONTHS_HIST,
+    )
+
+    return SimpleNamespace(success=True, data=mock_data)
@@ -0,0 +1,15 @@
+import pytest
+
+from tickersnap.stock import StockScorecardAPI
+
+
+@pytest.fixture(scope="module")
+def scorecard_api():
+    """
+    StockScorecardAPI client reused by the scorecard unit tests.
+
+    Each test routes its own SID URL through `respx_mock`, so nothing on the
+    client carries over between tests.
+    """
+    with StockScorecardAPI() as api:
+        yield api
@@ -16,8 +16,9 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from tickersnap.lists import AssetsListAPI
 from tickersnap.lists.models import AssetData, AssetType
-from tickersnap.stock import StockScorecard
+from tickersnap.stock import StockScorecard, StockScorecardAPI
 from tickersnap.stock.models import (
     Score,
     ScorecardElement,
@@ -887,6 +888,7 @@ class TestUnitStockScorecard:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("tickertape")
 class TestIntegrationStockScorecard:
     """
     Integration test suite for StockScorecard with real API calls.
@@ -895,6 +897,11 @@ class TestIntegrationStockScorecard:
     Keep these tests light to avoid overwhelming CI/CD pipelines.
     """
 
+    @pytest.fixture(scope="class", autouse=True)
+    def _require_api(self, skip_unless_reachable):
+        """Skip the whole class when either Tickertape API host is offline."""
+        skip_unless_reachable(AssetsListAPI.BASE_URL, StockScorecardAPI.BASE_URL)
+
     def test_get_scorecard_integration(self):
         """Test get_scorecard with real API call."""
         scorecard = StockScorecard(timeout=30)
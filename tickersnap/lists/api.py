@@ -87,6 +87,55 @@ class AssetsListAPI:
 
         self.client.close()
 
+    @classmethod
+    def _validate_filter(cls, filter: Optional[str]) -> Optional[str]:
+        """
+        Validate and normalize the assets list filter.
+
+        Runs without an HTTP client, so it can be used (and tested) on the class.
+
+        Args:
+            filter (Optional[str]): Filter to validate (see `get_data`).
+
+        Returns:
+            Optional[str]: Lowercase filter, or None if no filter was given.
+
+        Raises:
+            ValueError: If filter is not a valid option.
+        """
+
+        # no filter means fetch all assets
+        if filter is None:
+            return None
+
+        # validate filter is not empty or contains whitespaces
+        filter_stripped = filter.strip()
+        if filter_stripped == "":
+            raise ValueError(
+                f"Empty filter '{filter}' not allowed. "
+                f"Use filter=None or omit the parameter to get all assets. "
+                f"Valid filters: {', '.join(cls.VALID_FILTERS_SORTED_LIST)}"
+            )
+
+        # validate filter does not contain leading or trailing whitespaces
+        if filter_stripped != filter:
+            raise ValueError(
+                f"Filter '{filter}' contains leading or trailing whitespaces. "
+                f"Please remove the whitespaces and try again with correct filter. "
+                f"Valid filters: {', '.join(cls.VALID_FILTERS_SORTED_LIST)}"
+            )
+
+        # validate and normalize filter to accept both upper and lower case letters
+        filter_lower = filter.lower()
+        if filter_lower not in cls.VALID_FILTERS:
+            raise ValueError(
+                f"Invalid filter '{filter}'. Valid options are: "
+                f"{', '.join(cls.VALID_FILTERS_SORTED_LIST)}. "
+                f"All filters are case insensitive."
+            )
+
+        return filter_lower
+
     def get_data(self, filter: Optional[str] = None) -> AssetsListResponse:
         """
         Fetch all available list of assets (stocks and ETFs) from Tickertape,
@@ -109,33 +158,7 @@ class AssetsListAPI:
         """
 
         # input filter parameter validation and normalization
-        if filter is not None:
-            # validate filter is not empty or contains whitespaces
-            filter_stripped = filter.strip()
-            if filter_stripped == "":
-                raise ValueError(
-                    f"Empty filter '{filter}' not allowed. "
-                    f"Use filter=None or omit the parameter to get all assets. "
-                    f"Valid filters: {', '.join(self.VALID_FILTERS_SORTED_LIST)}"
-                )
-
-            # validate filter does not contain leading or trailing whitespaces
-            if filter_stripped != filter:
-                raise ValueError(
-                    f"Filter '{filter}' contains leading or trailing whitespaces. "
-                    f"Please remove the whitespaces and try again with correct filter. "
-                    f"Valid filters: {', '.join(self.VALID_FILTERS_SORTED_LIST)}"
-                )
-
-            # validate and normalize filter to accept both upper and lower case letters
-            filter_lower = filter.lower()
-            if filter_lower not in self.VALID_FILTERS:
-                raise ValueError(
-                    f"Invalid filter '{filter}'. Valid options are: "
-                    f"{', '.join(self.VALID_FILTERS_SORTED_LIST)}. "
-                    f"All filters are case insensitive."
-                )
-            filter = filter_lower
+        filter = self._validate_filter(filter)
 
         try:
             # build request parameters
@@ -10,7 +10,7 @@ Provides simplified access to stocks and ETFs data for common daily usage:
 Removes API complexity and provides clean, filtered lists for daily market analysis.
 """
 
-from typing import List
+from typing import List, Optional, Tuple
 
 from .api import AssetsListAPI
 from .models import AssetData, AssetType
@@ -24,6 +24,10 @@ class Assets:
 
     Returns only the essential fields needed for daily use: sid, name, ticker,
     slug, isin (and type when getting all assets).
+
+    The full assets list is fetched once and cached on the instance, so calling
+    several methods on the same `Assets` object makes a single API request.
+    Pass `force_refresh=True` to any method to re-fetch the latest data.
     """
 
     def __init__(self, timeout: int = 10):
@@ -35,42 +39,99 @@ class Assets:
         """
 
         self.timeout = timeout
+        self._cache: Optional[List[AssetData]] = None
+        self._partitions: Optional[Tuple[List[AssetData], List[AssetData]]] = None
+
+    def _fetch_assets(self, force_refresh: bool = False) -> List[AssetData]:
+        """
+        Get the full assets list, fetching it from the API if not cached.
+
+        Args:
+            force_refresh (bool): Ignore the cached list and re-fetch.
+                Defaults to False.
+
+        Returns:
+            List[AssetData]: Cached list of all assets.
+        """
+
+        if self._cache is None or force_refresh:
+            with AssetsListAPI(timeout=self.timeout) as client:
+                response = client.get_data()
+            self._cache = response.data
+            self._partitions = None
+
+        return self._cache
+
+    def _get_partitioned(
+        self, force_refresh: bool = False
+    ) -> Tuple[List[AssetData], List[AssetData]]:
+        """
+        Split the assets list into stocks and ETFs in a single pass.
+
+        The split is computed once per fetched list and cached alongside it.
+
+        Args:
+            force_refresh (bool): Ignore the cached list and re-fetch.
+                Defaults to False.
 
-    def get_all_stocks(self) -> List[AssetData]:
+        Returns:
+            Tuple[List[AssetData], List[AssetData]]: Cached (stocks, etfs) lists.
+        """
+
+        assets = self._fetch_assets(force_refresh)
+
+        if self._partitions is None:
+            stocks: List[AssetData] = []
+            etfs: List[AssetData] = []
+            for asset in assets:
+                if asset.type == AssetType.STOCK:
+                    stocks.append(asset)
+                elif asset.type == AssetType.ETF:
+                    etfs.append(asset)
+            self._partitions = (stocks, etfs)
+
+        return self._partitions
+
+    def get_all_stocks(self, force_refresh: bool = False) -> List[AssetData]:
         """
         Get all available stocks.
 
+        Args:
+            force_refresh (bool): Re-fetch the assets list instead of using
+                the cached one. Defaults to False.
+
         Returns:
             List[AssetData]: List of all stock assets with essential fields.
         """
 
-        with AssetsListAPI(timeout=self.timeout) as client:
-            response = client.get_data()
+        stocks, _ = self._get_partitioned(force_refresh)
+        return list(stocks)
 
-        return [asset for asset in response.data if asset.type == AssetType.STOCK]
-
-    def get_all_etfs(self) -> List[AssetData]:
+    def get_all_etfs(self, force_refresh: bool = False) -> List[AssetData]:
         """
         Get all available ETFs.
 
+        Args:
+            force_refresh (bool): Re-fetch the assets list instead of using
+                the cached one. Defaults to False.
+
         Returns:
             List[AssetData]: List of all ETF assets with essential fields.
         """
 
-        with AssetsListAPI(timeout=self.timeout) as client:
-            response = client.get_data()
-
-        return [asset for asset in response.data if asset.type == AssetType.ETF]
+        _, etfs = self._get_partitioned(force_refresh)
+        return list(etfs)
 
-    def get_all_assets(self) -> List[AssetData]:
+    def get_all_assets(self, force_refresh: bool = False) -> List[AssetData]:
         """
         Get all available assets (stocks + ETFs).
 
+        Args:
+            force_refresh (bool): Re-fetch the assets list instead of using
+                the cached one. Defaults to False.
+
         Returns:
             List[AssetData]: List of all assets with essential fields including type.
         """
 
-        with AssetsListAPI(timeout=self.timeout) as client:
-            response = client.get_data()
-
-        return response.data
+        return list(self._fetch_assets(force_refresh))
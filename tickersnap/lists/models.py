@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 # --------------------------------------------------------------------------------------
 # Tickertape API Models + Tickersnap User-Facing Model: AssetData
@@ -38,8 +38,11 @@ class AssetData(BaseModel):
     Note:
         - internal use only
         - used by models: `AssetsListResponse`
+        - immutable (frozen): instances are shared by the cached lists in `Assets`
     """
 
+    model_config = ConfigDict(frozen=True)
+
     sid: str
     name: str
     ticker: str